@@ -47,22 +47,27 @@ def _configure_logging(verbose: int = 0) -> None:
 click.disable_unicode_literals_warning = True  # type: ignore[attr-defined]
 
 
-def _print_diff(source_text: str, fixed_source_text: str) -> None:
-    differ = difflib.Differ()
-
-    source_lines       = source_text.splitlines()
-    fixed_source_lines = fixed_source_text.splitlines()
-    diff_lines         = differ.compare(source_lines, fixed_source_lines)
+def _print_diff(filename: str, source_text: str, fixed_source_text: str) -> None:
+    diff_lines = difflib.unified_diff(
+        source_text.splitlines(),
+        fixed_source_text.splitlines(),
+        fromfile=filename,
+        tofile=filename,
+        lineterm="",
+    )
     if not sys.stdout.isatty():
-        click.echo("\n".join(diff_lines))
+        sys.stdout.writelines(line + "\n" for line in diff_lines)
         return
 
-    for line in diff_lines:
-        if line.startswith("+ "):
+    for i, line in enumerate(diff_lines):
+        if i < 2:
+            # file header: "--- filename" and "+++ filename"
+            click.echo(line)
+        elif line.startswith("+"):
             click.echo("\u001b[32m" + line + "\u001b[0m")
-        elif line.startswith("- "):
+        elif line.startswith("-"):
             click.echo("\u001b[31m" + line + "\u001b[0m")
-        elif line.startswith("? "):
+        elif line.startswith("@@"):
             click.echo("\u001b[36m" + line + "\u001b[0m")
         else:
             click.echo(line)
@@ -171,7 +176,7 @@ def main(
             raise
 
         if diff:
-            _print_diff(source_text, fixed_source_text)
+            _print_diff(src_file.name, source_text, fixed_source_text)
         elif in_place:
             with io.open(src_file.name, mode="w", encoding="utf-8") as fobj:
                 fobj.write(fixed_source_text)
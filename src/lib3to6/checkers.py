@@ -15,7 +15,7 @@ from .checkers_backports import NoUnusableImportsChecker
 
 class NoStarImports(cb.CheckerBase):
     def __call__(self, ctx: common.BuildContext, tree: ast.Module) -> None:
-        for node in ast.walk(tree):
+        for node in common.walk(tree):
             if not isinstance(node, ast.ImportFrom):
                 continue
 
@@ -25,7 +25,7 @@ class NoStarImports(cb.CheckerBase):
 
 
 def _iter_scope_names(tree: ast.Module) -> typ.Iterable[typ.Tuple[str, ast.AST]]:
-    for node in ast.walk(tree):
+    for node in common.walk(tree):
         if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
             yield node.name, node
         elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
@@ -77,7 +77,7 @@ class NoOpenWithEncodingChecker(cb.CheckerBase):
     version_info = common.VersionInfo(apply_until="2.7")
 
     def __call__(self, ctx: common.BuildContext, tree: ast.Module) -> None:
-        for node in ast.walk(tree):
+        for node in common.walk(tree):
             if not isinstance(node, ast.Call):
                 continue
 
@@ -133,7 +133,7 @@ class NoAsyncAwait(cb.CheckerBase):
 
     def __call__(self, ctx: common.BuildContext, tree: ast.Module) -> None:
         async_await_node_types = (ast.AsyncFor, ast.AsyncWith, ast.AsyncFunctionDef, ast.Await)
-        for node in ast.walk(tree):
+        for node in common.walk(tree):
             if not isinstance(node, async_await_node_types):
                 continue
 
@@ -162,7 +162,7 @@ class NoYieldFromChecker(cb.CheckerBase):
 
     def __call__(self, ctx: common.BuildContext, tree: ast.Module) -> None:
 
-        for node in ast.walk(tree):
+        for node in common.walk(tree):
             if isinstance(node, ast.YieldFrom):
                 msg = (
                     "Prohibited use of 'yield from', which is not supported "
@@ -179,7 +179,7 @@ class NoMatMultOpChecker(cb.CheckerBase):
         if not hasattr(ast, 'MatMult'):
             return
 
-        for node in ast.walk(tree):
+        for node in common.walk(tree):
             if not isinstance(node, ast.BinOp):
                 continue
 
@@ -221,7 +221,7 @@ class NoComplexNamedTuple(cb.CheckerBase):
         _typing_module_name   : typ.Optional[str] = None
         _namedtuple_class_name: str = "NamedTuple"
 
-        for node in ast.walk(tree):
+        for node in common.walk(tree):
             if isinstance(node, ast.Import):
                 for alias in node.names:
                     if alias.name == 'typing':
@@ -30,11 +30,8 @@ class ModuleVersionInfo(typ.NamedTuple):
     backport_package: typ.Optional[str]
 
 
-def parse_version(version: str) -> typ.Any:
-    # pylint: disable=import-outside-toplevel; lazy import to speed up --help
-    import pkg_resources
-
-    return pkg_resources.parse_version(version)
+def _parse_version(version: str) -> typ.Tuple[int, ...]:
+    return tuple(int(part) for part in version.split("."))
 
 
 MAYBE_UNUSABLE_MODULES = {
@@ -64,21 +61,61 @@ MAYBE_UNUSABLE_MODULES = {
 }
 
 
-def _iter_module_names(node: ast.AST) -> typ.Iterable[str]:
-    if isinstance(node, ast.Import):
-        for alias in node.names:
-            yield alias.name
-    elif isinstance(node, ast.ImportFrom):
-        mname = node.module
-        if mname:
-            yield mname
+_UNUSABLE_KEYS = frozenset(MAYBE_UNUSABLE_MODULES)
+
+_AVAILABLE_SINCE = {
+    mname: _parse_version(vnfo.available_since) for mname, vnfo in MAYBE_UNUSABLE_MODULES.items()
+}
+
+
+def _check_module(ctx: common.BuildContext, node: ast.stmt, mname: str) -> None:
+    install_requires: typ.Optional[typ.Set[str]] = ctx.cfg.install_requires
+
+    target_version = ctx.cfg.target_version
+    vnfo           = MAYBE_UNUSABLE_MODULES[mname]
+    if _parse_version(target_version) >= _AVAILABLE_SINCE[mname]:
+        # target supports the newer name
+        return
+
+    bppkg = vnfo.backport_package
+
+    # if the backport has a different name, then there is no
+    # excuse not to use it -> hard error
+    is_backport_name_same = mname == vnfo.backport_module
+
+    is_whitelisted = (
+        is_backport_name_same
+        and install_requires is not None
+        and bppkg in install_requires
+    )
+    if is_whitelisted:
+        return
+
+    # From here, we either error or at least show a warning.
+
+    # if there is no backport, then the import can obviously only
+    # be using the stdlib module -> hard error
+    is_backported  = vnfo.backport_package is not None
+    is_strict_mode = install_requires      is not None
+    is_hard_error  = not is_backported or is_strict_mode or not is_backport_name_same
+
+    vnfo_msg = (
+        f"This module is available since Python {vnfo.available_since}, "
+        f"but you configured target_version='{target_version}'."
+    )
 
+    if is_hard_error:
+        errmsg = f"Prohibited import '{mname}'. {vnfo_msg}"
+        if bppkg:
+            errmsg += f" Use 'https://pypi.org/project/{bppkg}' instead."
+        else:
+            errmsg += " No backported for this package is known."
 
-def _iter_maybe_unusable_modules(node: ast.AST) -> typ.Iterable[typ.Tuple[str, ModuleVersionInfo]]:
-    for mname in _iter_module_names(node):
-        vnfo = MAYBE_UNUSABLE_MODULES.get(mname)
-        if vnfo:
-            yield (mname, vnfo)
+        raise common.CheckError(errmsg, node)
+    else:
+        lineno = common.get_node_lineno(node)
+        loc    = f"{ctx.filepath}@{lineno}"
+        logger.warning(f"{loc}: Use of import '{mname}'. {vnfo_msg}")
 
 
 class NoUnusableImportsChecker(cb.CheckerBase):
@@ -105,51 +142,12 @@ class NoUnusableImportsChecker(cb.CheckerBase):
         #     their config for this check to work and we don't want to
         #     break them.
 
-        install_requires: typ.Optional[set[str]] = ctx.cfg.install_requires
-
-        target_version = ctx.cfg.target_version
-        for node in ast.iter_child_nodes(tree):
-            for mname, vnfo in _iter_maybe_unusable_modules(node):
-                if parse_version(target_version) >= parse_version(vnfo.available_since):
-                    # target supports the newer name
-                    continue
-
-                bppkg = vnfo.backport_package
-
-                # if the backport has a different name, then there is no
-                # excuse not to use it -> hard error
-                is_backport_name_same = mname == vnfo.backport_module
-
-                is_whitelisted = (
-                    is_backport_name_same
-                    and install_requires is not None
-                    and bppkg in install_requires
-                )
-                if is_whitelisted:
-                    continue
-
-                # From here, we either error or at least show a warning.
-
-                # if there is no backport, then the import can obviously only
-                # be using the stdlib module -> hard error
-                is_backported  = vnfo.backport_package is not None
-                is_strict_mode = install_requires      is not None
-                is_hard_error  = not is_backported or is_strict_mode or not is_backport_name_same
-
-                vnfo_msg = (
-                    f"This module is available since Python {vnfo.available_since}, "
-                    f"but you configured target_version='{target_version}'."
-                )
-
-                if is_hard_error:
-                    errmsg = f"Prohibited import '{mname}'. {vnfo_msg}"
-                    if bppkg:
-                        errmsg += f" Use 'https://pypi.org/project/{bppkg}' instead."
-                    else:
-                        errmsg += " No backported for this package is known."
-
-                    raise common.CheckError(errmsg, node)
-                else:
-                    lineno = common.get_node_lineno(node)
-                    loc    = f"{ctx.filepath}@{lineno}"
-                    logger.warning(f"{loc}: Use of import '{mname}'. {vnfo_msg}")
+        for node in common.iter_child_nodes(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    if alias.name in _UNUSABLE_KEYS:
+                        _check_module(ctx, node, alias.name)
+            elif isinstance(node, ast.ImportFrom):
+                mname = node.module
+                if mname and mname in _UNUSABLE_KEYS:
+                    _check_module(ctx, node, mname)
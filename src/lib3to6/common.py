@@ -39,6 +39,49 @@ LeafNodeTypes = ConstantNodeTypes + (
 ContainerNodes = (ast.List, ast.Set, ast.Tuple)
 
 
+def iter_child_nodes(node: ast.AST) -> typ.List[ast.AST]:
+    """Return the direct child nodes of node, like ast.iter_child_nodes.
+
+    Returns a list rather than a generator, without going through
+    ast.iter_fields, which makes it faster than the stdlib version.
+    """
+    # pylint: disable=protected-access
+    children = []
+    for field_name in node._fields:
+        field = getattr(node, field_name, None)
+        if isinstance(field, ast.AST):
+            children.append(field)
+        elif isinstance(field, list):
+            for item in field:
+                if isinstance(item, ast.AST):
+                    children.append(item)
+    return children
+
+
+def walk(node: ast.AST) -> typ.Iterable[ast.AST]:
+    """Iterate over all nodes of a tree, in the same order as ast.walk.
+
+    The children of each node are collected inline rather than by
+    nesting the ast.iter_child_nodes and ast.iter_fields generators,
+    which is roughly twice as fast for large modules.
+    """
+    # pylint: disable=protected-access
+    todo = [node]
+    # NOTE: todo grows while we iterate over it, which gives us the
+    #   breadth first order of ast.walk without a deque. The body of
+    #   iter_child_nodes is inlined, the extra call per node costs ~25%.
+    for todo_node in todo:
+        for field_name in todo_node._fields:
+            field = getattr(todo_node, field_name, None)
+            if isinstance(field, ast.AST):
+                todo.append(field)
+            elif isinstance(field, list):
+                for item in field:
+                    if isinstance(item, ast.AST):
+                        todo.append(item)
+        yield todo_node
+
+
 class BuildConfig(typ.NamedTuple):
 
     target_version  : str  # e.g. "2.7"
@@ -123,6 +166,10 @@ class FixerError(Exception):
         self.filepath = filepath
         super().__init__(msg)
 
+    def __reduce__(self) -> typ.Tuple[typ.Any, ...]:
+        # errors raised in a worker process are pickled
+        return (type(self), (self.msg, self.node, self.parent, self.filepath))
+
     def __str__(self) -> str:
         msg = self.msg
         if self.filepath:
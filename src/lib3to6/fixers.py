@@ -159,7 +159,7 @@ class _FRAFContext:
             raise common.FixerError(msg, anno)
 
     def remove_forward_references(self, node: ast.AST) -> None:
-        for sub_node in ast.iter_child_nodes(node):
+        for sub_node in common.iter_child_nodes(node):
             if isinstance(sub_node, ast.FunctionDef):
                 self.update_annotation_refs(sub_node, 'returns')
 
@@ -190,7 +190,7 @@ class ForwardReferenceAnnotationsFixer(fb.FixerBase):
 
     def apply_fix(self, ctx: common.BuildContext, tree: ast.Module) -> ast.Module:
         local_classes: typ.Set[str] = set()
-        for node in ast.walk(tree):
+        for node in common.walk(tree):
             if isinstance(node, ast.ClassDef):
                 local_classes.add(node.name)
 
@@ -204,7 +204,7 @@ class RemoveFunctionDefAnnotationsFixer(fb.FixerBase):
     version_info = common.VersionInfo(apply_since="1.0", apply_until="2.7")
 
     def apply_fix(self, ctx: common.BuildContext, tree: ast.Module) -> ast.Module:
-        for node in ast.walk(tree):
+        for node in common.walk(tree):
             if isinstance(node, ast.FunctionDef):
                 node.returns = None
                 for arg in node.args.args:
@@ -244,7 +244,7 @@ class ShortToLongFormSuperFixer(fb.TransformerFixerBase):
 
     @staticmethod
     def visit_ClassDef(node: ast.ClassDef) -> ast.ClassDef:
-        for maybe_method in ast.walk(node):
+        for maybe_method in common.walk(node):
             if not isinstance(maybe_method, ast.FunctionDef):
                 continue
 
@@ -255,7 +255,7 @@ class ShortToLongFormSuperFixer(fb.TransformerFixerBase):
 
             self_arg: ast.arg = method_args.args[0]
 
-            for maybe_super_call in ast.walk(method):
+            for maybe_super_call in common.walk(method):
                 if not isinstance(maybe_super_call, ast.Call):
                     continue
 
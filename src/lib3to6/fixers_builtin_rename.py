@@ -16,7 +16,7 @@ class BuiltinsRenameFixerBase(fb.FixerBase):
     old_name: str
 
     def apply_fix(self, ctx: common.BuildContext, tree: ast.Module) -> ast.Module:
-        for node in ast.walk(tree):
+        for node in common.walk(tree):
             is_access_to_builtin = (
                 isinstance(node, ast.Name)
                 and isinstance(node.ctx, ast.Load)
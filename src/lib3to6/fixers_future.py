@@ -5,6 +5,8 @@
 # SPDX-License-Identifier: MIT
 
 import ast
+import typing as typ
+import functools
 
 from . import common
 from . import fixer_base as fb
@@ -14,8 +16,15 @@ class FutureImportFixerBase(fb.FixerBase):
 
     future_name: str
 
+    # one shared instance per subclass, rather than one per module
+    required_import: typ.ClassVar[common.ImportDecl]
+
+    def __init_subclass__(cls, **kwargs: typ.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.required_import = common.ImportDecl("__future__", cls.future_name, None)
+
     def apply_fix(self, ctx: common.BuildContext, tree: ast.Module) -> ast.Module:
-        self.required_imports.add(common.ImportDecl("__future__", self.future_name, None))
+        self.required_imports.add(self.required_import)
         return tree
 
 
@@ -82,20 +91,27 @@ class NestedScopesFutureFixer(FutureImportFixerBase):
     future_name = "nested_scopes"
 
 
+@functools.lru_cache(maxsize=16)
+def _supported_futures(target_version: str) -> typ.FrozenSet[str]:
+    # pylint:disable=no-member; yes it does
+    return frozenset(
+        cls.future_name
+        for cls in FutureImportFixerBase.__subclasses__()
+        if cls.version_info.is_compatible_with(target_version)
+    )
+
+
 class RemoveUnsupportedFuturesFixer(fb.FixerBase):
 
     version_info = common.VersionInfo(apply_since="2.0", apply_until="3.99")
 
     def apply_fix(self, ctx: common.BuildContext, tree: ast.Module) -> ast.Module:
-        target_version    = ctx.cfg.target_version
-        supported_futures = set()
-        for cls in FutureImportFixerBase.__subclasses__():
-            # pylint:disable=no-member; yes it does
-            if cls.version_info.is_compatible_with(target_version):
-                supported_futures.add(cls.future_name)
-
-        nodes_to_del = []
-        for i, node in enumerate(tree.body):
+        supported_futures = _supported_futures(ctx.cfg.target_version)
+
+        body = tree.body
+
+        nodes_to_del: typ.Set[int] = set()
+        for i, node in enumerate(body):
             is_doc_string = isinstance(node, ast.Expr) and (
                 isinstance(node.value, (ast.Constant, ast.Str))
             )
@@ -109,16 +125,17 @@ class RemoveUnsupportedFuturesFixer(fb.FixerBase):
             if not is_future_import:
                 break
 
-            new_names = [alias for alias in node.names if alias.name in supported_futures]
-            if new_names == node.names:
+            names     = node.names
+            new_names = [alias for alias in names if alias.name in supported_futures]
+            if len(new_names) == len(names):
                 continue
 
-            if not any(new_names):
-                nodes_to_del.append(i)
-            else:
+            if new_names:
                 node.names = new_names
+            else:
+                nodes_to_del.add(i)
 
-        for i in reversed(nodes_to_del):
-            del tree.body[i : i + 1]
+        if nodes_to_del:
+            tree.body = [node for i, node in enumerate(body) if i not in nodes_to_del]
 
         return tree
@@ -7,13 +7,18 @@
 import os
 import re
 import sys
+import json
+import time
 import shutil
 import typing as typ
 import hashlib
+import pathlib as pl
 import tempfile
 import warnings
+import functools
+import multiprocessing
+import concurrent.futures
 
-import pathlib2 as pl
 import setuptools.dist
 import setuptools.command.build_py as _build_py
 
@@ -32,8 +37,30 @@ PYTHON_TAG_PREFIXES = {
 }
 
 
+PYREQ_PATTERN = r">=([0-9]+\.[0-9]+)"
+
+PYREQ_RE = re.compile(PYREQ_PATTERN)
+
+
 CACHE_DIR = pl.Path(tempfile.gettempdir()) / ".lib3to6_cache"
 
+CACHE_INDEX_PATH = CACHE_DIR / "index.json"
+
+# Maps (config digest, absolute filepath) -> [st_mtime_ns, st_size, digest].
+# On a warm build, this allows us to find the transpiled output of a file
+# without reading and hashing its source.
+CacheIndex = typ.Dict[str, typ.List[typ.Any]]
+
+# Files modified less than this long before they are indexed are not indexed.
+RACY_MTIME_WINDOW_NS = 2 * 10 ** 9
+
+# hexdigest of blake2b(digest_size=20), also guards against paths outside of CACHE_DIR
+CACHE_DIGEST_RE = re.compile(r"[0-9a-f]{40}")
+
+_cache_index: typ.Optional[CacheIndex] = None
+
+_is_cache_dir_ready = False
+
 
 def eval_build_config(**kwargs) -> common.BuildConfig:
     target_version    = kwargs.get('target_version', transpile.DEFAULT_TARGET_VERSION)
@@ -68,25 +95,16 @@ def eval_build_config(**kwargs) -> common.BuildConfig:
 
 
 def _ignore_tmp_files(src: str, names: typ.List[str]) -> typ.List[str]:
-    if isinstance(src, str):
-        src_str = src
-    else:
-        # https://bugs.python.org/issue39390
-        if isinstance(src, os.DirEntry):
-            src_str = src.path
-        else:
-            src_str = str(src)
+    # https://bugs.python.org/issue39390
+    #   src may be an os.DirEntry, os.fspath covers that case
+    src_str = os.fspath(src)
 
-    if src_str.startswith("build") or src_str.startswith("./build"):
-        return names
-    if src_str.endswith(".egg-info"):
+    if src_str.startswith(("build", "./build")):
         return names
-    if src_str.endswith("dist"):
-        return names
-    if src_str.endswith("__pycache__"):
+    if src_str.endswith((".egg-info", "dist", "__pycache__")):
         return names
 
-    return [name for name in names if name.endswith(".pyc")]
+    return [name for name in names if name[-4:] == ".pyc"]
 
 
 def init_build_package_dir(local_package_dir: common.PackageDir) -> common.PackageDir:
@@ -114,12 +132,133 @@ def init_build_package_dir(local_package_dir: common.PackageDir) -> common.Packa
     return build_package_dir
 
 
-def transpile_path(cfg: common.BuildConfig, filepath: pl.Path) -> pl.Path:
-    with open(filepath, mode="rb") as fobj:
-        module_source_data = fobj.read()
+def _ensure_cache_dir() -> None:
+    # pylint:disable=global-statement ; checked once per process, not per build
+    global _is_cache_dir_ready
+
+    if not _is_cache_dir_ready:
+        CACHE_DIR.mkdir(exist_ok=True)
+        _is_cache_dir_ready = True
+
+
+def _is_valid_index_entry(index_key: typ.Any, entry: typ.Any) -> bool:
+    return (
+        isinstance(index_key, str)
+        and ":" in index_key
+        and isinstance(entry, list)
+        and len(entry) == 3
+        and all(isinstance(val, int) for val in entry[:2])
+        and isinstance(entry[2], str)
+        and CACHE_DIGEST_RE.fullmatch(entry[2]) is not None
+    )
+
+
+def _load_cache_index() -> CacheIndex:
+    # pylint:disable=global-statement ; loaded once, shared by all builds of a process
+    global _cache_index
+
+    if _cache_index is None:
+        try:
+            with open(CACHE_INDEX_PATH, mode="r", encoding="utf-8") as fobj:
+                raw_index = json.load(fobj)
+        except (OSError, ValueError):
+            raw_index = {}
+
+        # The index lives in a shared temp directory, so anything
+        # other than well formed entries is ignored.
+        if isinstance(raw_index, dict):
+            _cache_index = {
+                index_key: entry
+                for index_key, entry in raw_index.items()
+                if _is_valid_index_entry(index_key, entry)
+            }
+        else:
+            _cache_index = {}
+
+    assert _cache_index is not None
+    return _cache_index
+
+
+def _is_live_index_entry(index_key: str, entry: typ.List[typ.Any]) -> bool:
+    filepath   = index_key.split(":", 1)[1]
+    cache_path = CACHE_DIR / (entry[2] + ".py")
+    return os.path.exists(filepath) and cache_path.exists()
+
+
+def _save_cache_index() -> None:
+    if not _cache_index:
+        return
+
+    # The index is shared by all builds on this machine, so entries
+    # for files which no longer exist (deleted build directories, or
+    # cache files removed by a cleanup of the temp directory) are
+    # dropped to keep it from growing forever.
+    live_index = {
+        index_key: entry
+        for index_key, entry in _cache_index.items()
+        if _is_live_index_entry(index_key, entry)
+    }
+
+    # write + rename, so concurrent builds never see a partial index
+    tmp_path = CACHE_INDEX_PATH.with_name(f"index.{os.getpid()}.tmp")
+    with open(tmp_path, mode="w", encoding="utf-8") as fobj:
+        json.dump(live_index, fobj)
+    os.replace(tmp_path, CACHE_INDEX_PATH)
+
+
+def _cfg_key(cfg: common.BuildConfig) -> str:
+    # str(cfg) itself is not stable between processes: the order of
+    # the install_requires set depends on PYTHONHASHSEED.
+    if cfg.install_requires is None:
+        return str(cfg)
+    else:
+        return str(cfg._replace(install_requires=sorted(cfg.install_requires)))
+
+
+def _cfg_digest(cfg: common.BuildConfig) -> str:
+    return hashlib.blake2b(_cfg_key(cfg).encode("utf-8"), digest_size=20).hexdigest()
+
+
+def _cache_index_entry(cfg: common.BuildConfig, filepath: pl.Path) -> typ.Tuple[str, typ.List[int]]:
+    file_stat = os.stat(filepath)
+    index_key = _cfg_digest(cfg) + ":" + os.path.abspath(filepath)
+    return (index_key, [file_stat.st_mtime_ns, file_stat.st_size])
+
 
-    filehash = hashlib.sha1()
-    filehash.update(str(cfg).encode("utf-8"))
+def _lookup_cache_index(
+    cfg: common.BuildConfig, index_key: str, file_info: typ.List[int]
+) -> typ.Optional[pl.Path]:
+    if not cfg.cache_enabled:
+        return None
+
+    entry = _load_cache_index().get(index_key)
+    if entry is None or entry[:2] != file_info:
+        return None
+
+    cache_path = CACHE_DIR / (entry[2] + ".py")
+    if cache_path.exists():
+        return cache_path
+    else:
+        return None
+
+
+def _update_cache_index(index_key: str, file_info: typ.List[int], cache_path: pl.Path) -> None:
+    # A file which was modified just now can be modified again without a
+    # change to its mtime (setuptools' copy_file truncates it to whole
+    # seconds) or size. As with the "racy" entries of the git index,
+    # such files are not indexed; they are read and hashed next time.
+    mtime_ns = file_info[0]
+    if time.time() * 1e9 - mtime_ns < RACY_MTIME_WINDOW_NS:
+        return
+
+    _load_cache_index()[index_key] = file_info + [cache_path.stem]
+
+
+def _transpile_path(cfg: common.BuildConfig, filepath: pl.Path) -> pl.Path:
+    module_source_data = filepath.read_bytes()
+
+    filehash = hashlib.blake2b(digest_size=20)
+    filehash.update(_cfg_key(cfg).encode("utf-8"))
     filehash.update(module_source_data)
 
     cache_path = CACHE_DIR / (filehash.hexdigest() + ".py")
@@ -128,39 +267,155 @@ def transpile_path(cfg: common.BuildConfig, filepath: pl.Path) -> pl.Path:
         return cache_path
 
     # NOTE (mb 2020-09-01): not cache_enabled -> always update cache
-    ctx = common.BuildContext(cfg, str(filepath))
+
+    # NOTE: There is deliberately no cache for parsed (pickled) trees.
+    #   ast.parse is only a few percent of the time of transpile_module
+    #   (the fixers dominate), a hit in the output cache above already
+    #   skips the parse, and unpickling files from a shared temp
+    #   directory would allow other local users to execute code.
+    ctx = common.BuildContext(cfg, os.fspath(filepath))
     try:
         fixed_module_source_data = transpile.transpile_module_data(ctx, module_source_data)
     except common.CheckError as err:
-        loc = str(filepath)
+        loc = os.fspath(filepath)
         if err.lineno >= 0:
             loc += "@" + str(err.lineno)
 
         err.args = (loc + " - " + err.args[0],) + err.args[1:]
         raise
 
-    with open(cache_path, mode="wb") as fobj:
-        fobj.write(fixed_module_source_data)
+    # Write + rename: Another worker (or build) may be copying from
+    # cache_path, if it transpiled a file with the same contents.
+    tmp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(fixed_module_source_data)
+    os.replace(tmp_path, cache_path)
 
     return cache_path
 
 
-def build_package(cfg: common.BuildConfig, package: str, build_dir: str) -> None:
-    # pylint:disable=unused-argument ; `package` is part of the public api now
+def transpile_path(cfg: common.BuildConfig, filepath: pl.Path) -> pl.Path:
+    index_key, file_info = _cache_index_entry(cfg, filepath)
+
+    cache_path = _lookup_cache_index(cfg, index_key, file_info)
+    if cache_path is None:
+        cache_path = _transpile_path(cfg, filepath)
+        _update_cache_index(index_key, file_info, cache_path)
+
+    return cache_path
+
+
+def _copy_file(src: pl.Path, dst: pl.Path) -> None:
+    """Overwrite dst with the contents of src.
+
+    Uses os.sendfile to copy in the kernel, without the stat calls of
+    shutil.copy. Falls back to shutil.copyfile on platforms which don't
+    support sendfile between regular files.
+    """
+    if not hasattr(os, 'sendfile'):
+        shutil.copyfile(src, dst)
+        return
+
+    try:
+        with open(src, mode="rb") as src_fobj, open(dst, mode="wb") as dst_fobj:
+            src_fd = src_fobj.fileno()
+            dst_fd = dst_fobj.fileno()
+            size   = os.fstat(src_fd).st_size
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _iter_py_paths(build_dir: str) -> typ.Iterable[pl.Path]:
     for root, _dirs, files in os.walk(build_dir):
         for filename in files:
-            filepath = pl.Path(root) / filename
-            if filepath.suffix == ".py":
-                transpiled_path = transpile_path(cfg, filepath)
-                # overwrite original with transpiled
-                shutil.copy(transpiled_path, filepath)
+            if filename.endswith(".py"):
+                yield pl.Path(root) / filename
+
+
+def _get_mp_context() -> typ.Any:
+    # The spawn and forkserver start methods re-import the __main__
+    # module in each worker. During a build that is usually a setup.py
+    # without an `if __name__ == "__main__"` guard, so we only use a
+    # process pool if we can fork. Forking is only safe on Linux: on
+    # macOS, a process which forks after system frameworks have been
+    # loaded can crash (which is why spawn is the default there since
+    # Python 3.8), so everywhere else files are transpiled sequentially.
+    if sys.version_info < (3, 7):
+        return None
+    if not sys.platform.startswith("linux"):
+        return None
+    return multiprocessing.get_context("fork")
+
+
+def _transpile_paths(cfg: common.BuildConfig, filepaths: typ.Sequence[pl.Path]) -> None:
+    """Transpile files and overwrite each original with its transpiled version.
+
+    Each file is parsed, fixed and unparsed independently, so the
+    (CPU bound) work is distributed over a process pool. The parent
+    process meanwhile does the I/O: it copies back cached files and
+    each result as soon as it is available.
+    """
+    index_entries = [_cache_index_entry(cfg, filepath) for filepath in filepaths]
+    cached_paths  = [_lookup_cache_index(cfg, *entry) for entry in index_entries]
+
+    missing = [
+        (filepath, index_entry)
+        for filepath, index_entry, cached_path in zip(filepaths, index_entries, cached_paths)
+        if cached_path is None
+    ]
+    missing_paths = [filepath for filepath, _ in missing]
+
+    def _copy_results(transpiled_paths: typ.Iterable[pl.Path]) -> None:
+        for filepath, cached_path in zip(filepaths, cached_paths):
+            if cached_path is not None:
+                _copy_file(cached_path, filepath)
+
+        for (filepath, index_entry), transpiled_path in zip(missing, transpiled_paths):
+            _update_cache_index(*index_entry, transpiled_path)
+            _copy_file(transpiled_path, filepath)
+
+    transpile_missing = functools.partial(_transpile_path, cfg)
+
+    # With fork, the pool starts all of its workers up front, so there
+    # are never more of them than there are files to transpile.
+    mp_context = _get_mp_context()
+    workers    = min(os.cpu_count() or 1, len(missing_paths))
+    if mp_context is None or workers < 2:
+        _copy_results(map(transpile_missing, missing_paths))
+    else:
+        # Chunks reduce the IPC overhead, but they must be small enough
+        # that every worker still gets some of the files.
+        chunksize = min(4, max(1, len(missing_paths) // (4 * workers)))
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, mp_context=mp_context
+        ) as executor:
+            # map submits all tasks immediately and yields results in order
+            _copy_results(executor.map(transpile_missing, missing_paths, chunksize=chunksize))
+
+    # nothing to write back on a fully cached build
+    if missing_paths:
+        _save_cache_index()
+
+
+def build_package(cfg: common.BuildConfig, package: str, build_dir: str) -> None:
+    # pylint:disable=unused-argument ; `package` is part of the public api now
+    _transpile_paths(cfg, list(_iter_py_paths(build_dir)))
 
 
 def build_packages(cfg: common.BuildConfig, build_package_dir: common.PackageDir) -> None:
-    CACHE_DIR.mkdir(exist_ok=True)
+    _ensure_cache_dir()
 
-    for package, build_dir in build_package_dir.items():
-        build_package(cfg, package, build_dir)
+    # The files of all packages are transpiled by one process pool,
+    # which also keeps all cores busy if individual packages are small.
+    py_paths = [
+        py_path for build_dir in build_package_dir.values() for py_path in _iter_py_paths(build_dir)
+    ]
+    _transpile_paths(cfg, py_paths)
 
 
 def fix(
@@ -188,16 +443,23 @@ def fix(
 class build_py(_build_py.build_py):
     # pylint: disable=invalid-name      ; following the convention of setuptools
 
+    def initialize_options(self) -> None:
+        super().initialize_options()
+        # the distribution doesn't change between runs of the same command
+        self._lib3to6_build_cfg: typ.Optional[common.BuildConfig] = None
+
     def _get_outputs(self) -> typ.List[str]:
         outputs = _build_py.orig.build_py.get_outputs(self, include_bytecode=0)  # type: ignore[attr-defined]
         return typ.cast(typ.List[str], outputs)
 
-    def run_3to6(self) -> None:
-        outputs = self._get_outputs()
-        dist    = self.distribution
-        pyreq   = dist.python_requires
+    def _get_build_cfg(self) -> common.BuildConfig:
+        if self._lib3to6_build_cfg is not None:
+            return self._lib3to6_build_cfg
 
-        preq_match = isinstance(pyreq, str) and re.match(r">=([0-9]+\.[0-9]+)", pyreq)
+        dist  = self.distribution
+        pyreq = dist.python_requires
+
+        preq_match = PYREQ_RE.match(pyreq) if isinstance(pyreq, str) else None
         if preq_match:
             target_version = preq_match.group(1)
         else:
@@ -210,12 +472,16 @@ class build_py(_build_py.build_py):
             install_requires=install_requires,
             default_mode=getattr(dist, 'lib3to6_default_mode', 'enabled'),
         )
+        self._lib3to6_build_cfg = build_cfg
+        return build_cfg
 
-        CACHE_DIR.mkdir(exist_ok=True)
-        for output in outputs:
-            if output.endswith(".py"):
-                transpiled_path = transpile_path(build_cfg, pl.Path(output))
-                shutil.copy(transpiled_path, output)
+    def run_3to6(self) -> None:
+        outputs   = self._get_outputs()
+        build_cfg = self._get_build_cfg()
+
+        _ensure_cache_dir()
+        py_paths = [pl.Path(output) for output in outputs if output.endswith(".py")]
+        _transpile_paths(build_cfg, py_paths)
 
     def run(self) -> None:
         """Build modules, packages, and copy data files to build directory"""
@@ -35,6 +35,13 @@ SOURCE_ENCODING_PATTERN = r"""
 SOURCE_ENCODING_RE = re.compile(SOURCE_ENCODING_PATTERN, re.VERBOSE)
 
 
+# The module header ends (at the latest) before the first line that
+# starts with code. Only the part before it has to be split into lines.
+# Lines starting with non-ascii bytes might be whitespace after decoding.
+HEADER_END_RE       = re.compile(r"^[^#\s]", flags=re.MULTILINE)
+HEADER_END_BYTES_RE = re.compile(rb"^[^#\s\x80-\xff]", flags=re.MULTILINE)
+
+
 MODE_MARKER_PATTERN = r"#\s*lib3to6:\s*(?P<mode>disabled|enabled)"
 
 MODE_MARKER_RE = re.compile(MODE_MARKER_PATTERN, flags=re.MULTILINE)
@@ -65,6 +72,15 @@ def parse_module_header(module_source: typ.Union[bytes, str], target_version: st
 
     header_lines: typ.List[str] = []
 
+    header_end: typ.Optional[typ.Match]
+    if isinstance(module_source, bytes):
+        header_end = HEADER_END_BYTES_RE.search(module_source)
+    else:
+        header_end = HEADER_END_RE.search(module_source)
+
+    if header_end:
+        module_source = module_source[: header_end.start()]
+
     for i, line_data in enumerate(module_source.splitlines()):
         assert isinstance(line_data, (bytes, str))
         line = _parse_header_line(line_data, coding or DEFAULT_SOURCE_ENCODING)
@@ -331,7 +347,9 @@ def add_module_declarations(tree: ast.Module, module_declarations: typ.Set[str])
         imports_end_offset += 1
 
 
-def transpile_module(ctx: common.BuildContext, module_source: str) -> str:
+def transpile_module(
+    ctx: common.BuildContext, module_source: str, header: typ.Optional[ModuleHeader] = None
+) -> str:
     _module_header = module_source.split("import", 1)[0]
     _module_header = _module_header.split("'''", 1)[0]
     _module_header = _module_header.split('"""', 1)[0]
@@ -372,13 +390,14 @@ def transpile_module(ctx: common.BuildContext, module_source: str) -> str:
         add_required_imports(module_tree, required_imports)
     if any(module_declarations):
         add_module_declarations(module_tree, module_declarations)
-    header = parse_module_header(module_source, target_version)
-    return header.text + "".join(astor.to_source(module_tree))
+    if header is None:
+        header = parse_module_header(module_source, target_version)
+    return header.text + astor.to_source(module_tree)
 
 
 def transpile_module_data(ctx: common.BuildContext, module_source_data: bytes) -> bytes:
     target_version      = ctx.cfg.target_version
     header              = parse_module_header(module_source_data, target_version)
     module_source       = module_source_data.decode(header.coding)
-    fixed_module_source = transpile_module(ctx, module_source)
+    fixed_module_source = transpile_module(ctx, module_source, header)
     return fixed_module_source.encode(header.coding)
@@ -12,10 +12,6 @@ import astor
 from . import common
 from . import transpile
 
-# Recursive types not fully supported yet, nested types replaced with "Any"
-# NodeOrNodelist = typ.Union[ast.AST, typ.List["NodeOrNodelist"]]
-NodeOrNodelist = typ.Union[ast.AST, typ.List[typ.Any]]
-
 
 # https://gist.github.com/marsam/d2a5af1563d129bb9482
 def dump_ast(
@@ -35,59 +31,105 @@ def dump_ast(
     to True.
     """
 
-    def _format(node: NodeOrNodelist, level: int = 1) -> str:
-        # pylint: disable=protected-access
-        if isinstance(node, ast.AST):
-            fields = [(a, _format(b, level + 1)) for a, b in ast.iter_fields(node)]
-            if include_attributes and node._attributes:
-                fields.extend([(a, _format(getattr(node, a), level + 1)) for a in node._attributes])
+    # pylint: disable=protected-access
+    if not isinstance(node, (ast.AST, list)):
+        raise TypeError("expected AST, got %r" % node.__class__.__name__)
 
-            if annotate_fields:
-                field_parts = ["%s=%s" % field for field in fields]
-            else:
-                field_parts = [b for a, b in fields]
+    short_node_types = (ast.Name, ast.Num, ast.Str, ast.Bytes, ast.alias)
+
+    buf: typ.List[str] = []
+
+    # separators for multiline nodes/lists depend only on the level
+    level_seps: typ.Dict[int, typ.Tuple[str, str, str, str]] = {}
+
+    def _level_seps(level: int) -> typ.Tuple[str, str, str, str]:
+        prefix     = "\n" + indent * level
+        end_prefix = ",\n" + indent * (level - 1)
+        seps       = (prefix, "," + prefix, end_prefix + ")", end_prefix + "]")
+        level_seps[level] = seps
+        return seps
+
+    # Items on the stack are either strings, which are written to buf
+    # as they are, or (node, level) pairs which are yet to be formatted.
+    stack: typ.List[typ.Any] = [(node, 1)]
+
+    # local aliases, these are looked up for every item
+    node_type = ast.AST
+    write     = buf.append
+    push      = stack.append
+    push_todo = stack.extend
+    pop       = stack.pop
+
+    while stack:
+        item = pop()
+        if isinstance(item, str):
+            write(item)
+            continue
+
+        node, level = item
+        if isinstance(node, node_type):
+            try:
+                fields = [(a, getattr(node, a)) for a in node._fields]
+            except AttributeError:
+                # nodes created by fixers may not have all fields set
+                fields = list(ast.iter_fields(node))
+            if include_attributes and node._attributes:
+                fields.extend([(a, getattr(node, a)) for a in node._attributes])
 
-            node_name     = node.__class__.__name__
-            is_short_node = len(field_parts) <= 1 or isinstance(
-                node, (ast.Name, ast.Num, ast.Str, ast.Bytes, ast.alias)
-            )
+            is_short_node = len(fields) <= 1 or isinstance(node, short_node_types)
 
             if is_short_node:
-                return node_name + "(" + ", ".join(field_parts) + ")"
-
-            lines = [node_name + "("]
-            for part in field_parts:
-                lines.append((indent * level) + part + ",")
-            lines.append((indent * (level - 1)) + ")")
-            return "\n".join(lines)
+                sep, next_sep, end = "", ", ", ")"
+            else:
+                sep, next_sep, end, _ = level_seps.get(level) or _level_seps(level)
+
+            write(node.__class__.__name__ + "(")
+            todo: typ.List[typ.Any] = []
+            for name, value in fields:
+                todo.append(f"{sep}{name}=" if annotate_fields else sep)
+                todo.append((value, level + 1))
+                sep = next_sep
+            todo.append(end)
+            push_todo(reversed(todo))
         elif isinstance(node, list):
-            subnodes = node
-            if len(subnodes) == 0:
-                return "[]"
-
-            if len(subnodes) == 1:
-                return "[" + _format(subnodes[0], level) + "]"
-
-            lines = [indent * level + _format(subnode, level + 1) + "," for subnode in subnodes]
-            return "[\n" + "\n".join(lines) + "\n" + indent * (level - 1) + "]"
-        return repr(node)
+            if len(node) == 0:
+                write("[]")
+            elif len(node) == 1:
+                write("[")
+                push("]")
+                push((node[0], level))
+            else:
+                write("[")
+                sep, next_sep, _, end = level_seps.get(level) or _level_seps(level)
+                todo = []
+                for subnode in node:
+                    todo.append(sep)
+                    todo.append((subnode, level + 1))
+                    sep = next_sep
+                todo.append(end)
+                push_todo(reversed(todo))
+        else:
+            write(repr(node))
 
-    if isinstance(node, (ast.AST, list)):
-        return _format(node)
-    else:
-        raise TypeError("expected AST, got %r" % node.__class__.__name__)
+    return "".join(buf)
 
 
 def clean_whitespace(fixture_str: str) -> str:
     if fixture_str.strip().count("\n") == 0:
         return fixture_str.strip()
 
-    fixture_lines = [line for line in fixture_str.splitlines() if line.strip()]
-    line_indents  = [len(line) - len(line.lstrip()) for line in fixture_lines]
-    if not any(line_indents) or min(line_indents) == 0:
-        return fixture_str
+    fixture_lines: typ.List[str] = []
+    indent = len(fixture_str)
+    for line in fixture_str.splitlines():
+        line_indent = len(line) - len(line.lstrip())
+        if line_indent == len(line):
+            continue    # blank line
+        if line_indent == 0:
+            return fixture_str
+
+        indent = min(indent, line_indent)
+        fixture_lines.append(line)
 
-    indent         = min(line_indents)
     dedented_lines = [line[indent:] for line in fixture_lines]
     return "\n".join(dedented_lines).strip() + "\n"
 
@@ -112,7 +154,7 @@ def parsedump_source(code: str, mode: str = "exec") -> str:
 def transpile_and_dump(ctx: common.BuildContext, module_str: str) -> typ.Tuple[str, str, str]:
     module_str = clean_whitespace(module_str)
     header     = transpile.parse_module_header(module_str, ctx.cfg.target_version)
-    result_str = transpile.transpile_module(ctx, module_str)
+    result_str = transpile.transpile_module(ctx, module_str, header)
     return header.coding, header.text, result_str
 
 
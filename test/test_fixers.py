@@ -1,3 +1,5 @@
+import ast
+import functools
 import collections
 
 import pytest
@@ -11,6 +13,16 @@ FixerFixture = collections.namedtuple(
 )
 
 
+# The expected sources are parsed and normalized more than once per
+# test case. Caching here (rather than in lib3to6.utils) keeps the
+# caches out of the library; only strings are cached, no trees.
+@functools.lru_cache(maxsize=None)
+def _parsedump(code):
+    # ast.dump is enough for comparisons, utils.parsedump_ast is
+    # only needed for readable output.
+    return ast.dump(ast.parse(code))
+
+
 def make_fixture(names, target_version, test_source, expected_source):
     test_source     = utils.clean_whitespace(test_source)
     expected_source = utils.clean_whitespace(expected_source)
@@ -22,8 +34,8 @@ def test_numeric_literals_with_underscore():
     #   this case is taken care off by the fact that there
     #   is no representation of the underscores at the ast
     #   level.
-    a_ast = utils.parsedump_ast("x = 200_000_000")
-    b_ast = utils.parsedump_ast("x = 200000000")
+    a_ast = _parsedump("x = 200_000_000")
+    b_ast = _parsedump("x = 200000000")
     assert a_ast == b_ast
 
 
@@ -61,8 +73,8 @@ def test_header_preserved():
     assert result_header_coding == "utf-8"
     assert expected_source      == result_source
 
-    expected_ast = utils.parsedump_ast(expected_source)
-    result_ast   = utils.parsedump_ast(result_source)
+    expected_ast = _parsedump(expected_source)
+    result_ast   = _parsedump(result_source)
     assert expected_ast == result_ast
 
 
@@ -1209,11 +1221,11 @@ FIXTURES = [
 ]
 
 
+@functools.lru_cache(maxsize=None)
 def _normalized_source(in_source):
     """This is mostly to get rid of comments"""
-    in_source  = utils.clean_whitespace(in_source)
     out_source = utils.parsedump_source(in_source)
-    assert utils.parsedump_ast(out_source) == utils.parsedump_ast(in_source)
+    assert _parsedump(out_source) == _parsedump(in_source)
     return out_source
 
 
@@ -1224,8 +1236,8 @@ def _debug_ast(casename, source):
     if DEBUG_VERBOSITY > 0:
         print(casename.upper() * 9)
         if DEBUG_VERBOSITY > 1:
-            ast = utils.parsedump_ast(source)
-            print(ast)
+            ast_dump = utils.parsedump_ast(source)
+            print(ast_dump)
             print("-------- " * 9)
         if DEBUG_VERBOSITY > 2:
             print(repr(source))
@@ -1234,11 +1246,12 @@ def _debug_ast(casename, source):
 
 @pytest.mark.parametrize("fixture", FIXTURES)
 def test_fixers(fixture):
-    expected_source = utils.clean_whitespace(fixture.expected_source)
-    expected_ast    = utils.parsedump_ast(expected_source)
+    # NOTE: make_fixture already applied clean_whitespace
+    expected_source = fixture.expected_source
+    expected_ast    = _parsedump(expected_source)
     expected_header = transpile.parse_module_header(expected_source, fixture.target_version)
 
-    test_source = utils.clean_whitespace(fixture.test_source)
+    test_source = fixture.test_source
 
     _debug_ast("testcase", test_source)
     _debug_ast("expected", expected_source)
@@ -1251,7 +1264,7 @@ def test_fixers(fixture):
 
     _debug_ast("result", result_source)
 
-    result_ast = utils.parsedump_ast(result_source)
+    result_ast = _parsedump(result_source)
 
     assert result_header_coding == expected_header.coding
     assert result_header_text   == expected_header.text
@@ -0,0 +1,157 @@
+import os
+import json
+import time
+
+import pytest
+
+from lib3to6 import common
+from lib3to6 import packaging
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    # Don't use (or write to) the cache of the user running the tests.
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    monkeypatch.setattr(packaging, 'CACHE_DIR'       , cache_dir)
+    monkeypatch.setattr(packaging, 'CACHE_INDEX_PATH', cache_dir / "index.json")
+    monkeypatch.setattr(packaging, '_cache_index'    , None)
+    return cache_dir
+
+
+def _write_module(path, source, mtime=None):
+    path.write_text(source)
+    # Backdated, recently modified files are not added to the cache index.
+    if mtime is None:
+        mtime = time.time() - 10
+    os.utime(path, (mtime, mtime))
+
+
+def _init_package(tmp_path, modules, name="mypkg"):
+    package_dir = tmp_path / name
+    package_dir.mkdir()
+    for filename, source in modules.items():
+        _write_module(package_dir / filename, source)
+    return str(package_dir)
+
+
+def test_build_packages(tmp_path):
+    modules = {f"mod{i}.py": f"def f{i}(x: int) -> int:\n    return x\n" for i in range(8)}
+    package_dir = _init_package(tmp_path, modules)
+
+    cfg = packaging.eval_build_config(target_version="2.7")
+    packaging.build_packages(cfg, {'mypkg': package_dir})
+
+    for i in range(8):
+        with open(f"{package_dir}/mod{i}.py", mode="r") as fobj:
+            result = fobj.read()
+        assert "from __future__ import" in result
+        assert f"def f{i}(x):" in result
+
+
+def test_build_packages_error(tmp_path):
+    modules = {f"mod{i}.py": "x = 1\n" for i in range(4)}
+    modules['bad.py'] = "import asyncio\n"
+    package_dir = _init_package(tmp_path, modules)
+
+    cfg = packaging.eval_build_config(target_version="2.7")
+    with pytest.raises(common.CheckError) as excinfo:
+        packaging.build_packages(cfg, {'mypkg': package_dir})
+
+    assert "bad.py@1 - Prohibited import 'asyncio'" in str(excinfo.value)
+
+
+def test_build_multiple_packages(tmp_path):
+    package_dirs = {
+        'pkg_a': _init_package(tmp_path, {"a.py": "x: int = 1\n"}, name="pkg_a"),
+        'pkg_b': _init_package(tmp_path, {"b.py": "y: int = 2\n"}, name="pkg_b"),
+    }
+
+    cfg = packaging.eval_build_config(target_version="2.7")
+    packaging.build_packages(cfg, package_dirs)
+
+    with open(f"{package_dirs['pkg_a']}/a.py", mode="r") as fobj:
+        assert fobj.read().endswith("\nx = 1\n")
+    with open(f"{package_dirs['pkg_b']}/b.py", mode="r") as fobj:
+        assert fobj.read().endswith("\ny = 2\n")
+
+
+def test_cfg_digest_install_requires_order():
+    cfg_a = packaging.eval_build_config(target_version="2.7", install_requires=["a", "b", "c"])
+    cfg_b = packaging.eval_build_config(target_version="2.7", install_requires=["c", "b", "a"])
+    assert packaging._cfg_key(cfg_a).endswith("install_requires=['a', 'b', 'c'])")
+    assert packaging._cfg_digest(cfg_a) == packaging._cfg_digest(cfg_b)
+
+
+def test_cache_index_pruning(tmp_path, monkeypatch, cache_dir):
+    package_dir = _init_package(tmp_path, {"a.py": "x = 1\n", "b.py": "y = 2\n"})
+    cfg         = packaging.eval_build_config(target_version="2.7")
+    packaging.build_packages(cfg, {'mypkg': package_dir})
+    assert len(json.loads((cache_dir / "index.json").read_text())) == 2
+
+    os.remove(os.path.join(package_dir, "b.py"))
+    _write_module(tmp_path / "mypkg" / "c.py", "z = 3\n")
+    monkeypatch.setattr(packaging, '_cache_index', None)
+    packaging.build_packages(cfg, {'mypkg': package_dir})
+
+    index = json.loads((cache_dir / "index.json").read_text())
+    assert sorted(key.rsplit(os.sep, 1)[-1] for key in index) == ["a.py", "c.py"]
+
+
+@pytest.mark.parametrize(
+    "index_data",
+    [
+        "[1, 2]",
+        '"index"',
+        '{"key": [1, 2]}',
+        '{"cfg:/path": [1, 2, 3]}',
+        '{"cfg:/path": [1, 2, "../../etc/passwd"]}',
+        "{not json",
+    ],
+)
+def test_invalid_cache_index(tmp_path, cache_dir, index_data):
+    (cache_dir / "index.json").write_text(index_data)
+
+    package_dir = _init_package(tmp_path, {"a.py": "x: int = 1\n"})
+    cfg         = packaging.eval_build_config(target_version="2.7")
+    packaging.build_packages(cfg, {'mypkg': package_dir})
+
+    with open(os.path.join(package_dir, "a.py"), mode="r") as fobj:
+        assert fobj.read().endswith("\nx = 1\n")
+
+
+def test_cache_index_hit(tmp_path, monkeypatch):
+    source      = "x: int = 1\n"
+    package_dir = _init_package(tmp_path, {"a.py": source})
+    module_path = tmp_path / "mypkg" / "a.py"
+    mtime       = os.stat(module_path).st_mtime
+
+    cfg = packaging.eval_build_config(target_version="2.7")
+    packaging.build_packages(cfg, {'mypkg': package_dir})
+
+    # A warm build of an unchanged file neither reads nor transpiles it.
+    def _fail(*args):
+        raise AssertionError("_transpile_path called for unchanged file")
+
+    _write_module(module_path, source, mtime)
+    monkeypatch.setattr(packaging, '_transpile_path', _fail)
+    monkeypatch.setattr(packaging, '_cache_index'   , None)
+    packaging.build_packages(cfg, {'mypkg': package_dir})
+
+    assert module_path.read_text().endswith("\nx = 1\n")
+
+
+def test_cache_index_racy_entry(tmp_path, cache_dir):
+    package_dir = _init_package(tmp_path, {})
+    module_path = tmp_path / "mypkg" / "version.py"
+    mtime       = int(time.time())
+
+    cfg = packaging.eval_build_config(target_version="2.7")
+    _write_module(module_path, "VERSION = 'v1'\n", mtime)
+    packaging.build_packages(cfg, {'mypkg': package_dir})
+    assert not (cache_dir / "index.json").exists()
+
+    # same size and mtime, but different content
+    _write_module(module_path, "VERSION = 'v2'\n", mtime)
+    packaging.build_packages(cfg, {'mypkg': package_dir})
+    assert module_path.read_text().endswith("\nVERSION = 'v2'\n")
@@ -1,3 +1,4 @@
+from lib3to6 import common
 from lib3to6 import transpile
 from lib3to6.utils import clean_whitespace
 
@@ -31,3 +32,37 @@ def test_parse_header_coding():
     header      = transpile.parse_module_header(source_data, "2.7")
     assert header.coding == "shift_jis"
     assert header.text   == "# coding: shift_jis\n# 今日は\n"
+
+
+def test_transpile_module_without_code():
+    # Modules without code still get a coding declaration and the
+    # __future__ imports. Without the declaration, Python 2 can't
+    # import a module with a non-ascii comment.
+    future_imports = (
+        "from __future__ import absolute_import\n"
+        "from __future__ import division\n"
+        "from __future__ import print_function\n"
+        "from __future__ import unicode_literals\n"
+    )
+    coding_decl = "# -*- coding: utf-8 -*-\n"
+
+    ctx = common.init_build_context(target_version="2.7")
+    assert transpile.transpile_module(ctx, "") == coding_decl + future_imports
+    assert transpile.transpile_module(ctx, "\n") == coding_decl + "\n" + future_imports
+
+    source   = "# comment only\n\n  # indented comment\n"
+    expected = coding_decl + "# comment only\n\n" + future_imports
+    assert transpile.transpile_module(ctx, source) == expected
+
+    source   = "# Copyright © 2021 Jörg\n"
+    expected = coding_decl + source + future_imports
+    assert transpile.transpile_module(ctx, source) == expected
+
+
+def test_transpile_module_data_coding():
+    source      = "# coding: shift_jis\n# 今日は\nexpr = '今日は'\n"
+    ctx         = common.init_build_context(target_version="2.7")
+    result_data = transpile.transpile_module_data(ctx, source.encode("shift_jis"))
+    result      = result_data.decode("shift_jis")
+    assert result.startswith("# coding: shift_jis\n# 今日は\n")
+    assert "今日は" in result.split("\n", 2)[2]
@@ -0,0 +1,46 @@
+from lib3to6 import utils
+
+
+def test_parsedump_ast():
+    expected = "\n".join(
+        [
+            "Expression(body=Call(",
+            "    func=Name(id='f', ctx=Load()),",
+            "    args=[",
+            "      Name(id='a', ctx=Load()),",
+            "      Attribute(",
+            "        value=Name(id='b', ctx=Load()),",
+            "        attr='c',",
+            "        ctx=Load(),",
+            "      ),",
+            "    ],",
+            "    keywords=[],",
+            "  ))",
+        ]
+    )
+    assert utils.parsedump_ast("f(a, b.c)", mode="eval") == expected
+
+
+def test_parsedump_ast_options():
+    expected = "\n".join(
+        [
+            "Expression(List(",
+            "        [Name('a', Load())],",
+            "        Load(),",
+            "    ))",
+        ]
+    )
+    result = utils.parsedump_ast("[a]", mode="eval", annotate_fields=False, indent="    ")
+    assert result == expected
+
+
+def test_clean_whitespace():
+    assert utils.clean_whitespace("  x = 1  ") == "x = 1"
+    assert utils.clean_whitespace("x = 1\n  y = 2\n") == "x = 1\n  y = 2\n"
+
+    fixture_str = """
+        if x:
+
+            y = 2
+    """
+    assert utils.clean_whitespace(fixture_str) == "if x:\n    y = 2\n"